@@ -5,6 +5,8 @@ from sc2.player import Bot, Computer
 
 from sc2_helper import CombatPredictor, CombatSettings, test_unit, test_units
 
+BENCH_ITERATIONS: int = 10000
+
 
 class basic_bot(BotAI):
     def __init__(self):
@@ -28,18 +30,22 @@ class basic_bot(BotAI):
             # await self.client.debug_upgrade()
         if self.units(UnitTypeId.MARINE):
             zergling = self.enemy_units(UnitTypeId.BATTLECRUISER)[0]
-            # s = perf_counter_ns()
-            test_unit(zergling)
+            # time a batch of calls, a timer read per call costs more than
+            # the call itself
+            s = perf_counter_ns()
+            for _ in range(BENCH_ITERATIONS):
+                test_unit(zergling)
+            e = perf_counter_ns()
+            t = (e - s) / BENCH_ITERATIONS
+            print(t)
+            self.single += t
             await self.client.leave()
-            # e = perf_counter_ns()
-            # t = e - s
-            # print(t)
-            # self.single += t
             # zerglings = self.units().filter(lambda x: x.type_id == UnitTypeId.ZERGLING)
             # s = perf_counter_ns()
-            # test_units(zerglings)
+            # for _ in range(BENCH_ITERATIONS):
+            #     test_units(zerglings)
             # e = perf_counter_ns()
-            # t = e-s
+            # t = (e - s) / BENCH_ITERATIONS
             # print(t)
             # self.double += t
             print(
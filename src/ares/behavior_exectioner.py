@@ -53,7 +53,11 @@ class BehaviorExecutioner:
         -------
 
         """
+        # bind once, this loop runs for every registered behavior each step
+        ai: "AresBot" = self.ai
+        config: dict = self.config
+        mediator: ManagerMediator = self.mediator
         for behavior in self.behaviors:
-            behavior.execute(self.ai, self.config, self.mediator)
+            behavior.execute(ai, config, mediator)
 
-        self.behaviors = []
+        self.behaviors.clear()
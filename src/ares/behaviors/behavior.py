@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING
 
 from ares.managers.manager_mediator import ManagerMediator
 
@@ -6,9 +6,12 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-class Behavior(Protocol):
+class Behavior:
     """Interface that all behaviors should adhere to."""
 
+    # keep slotted subclasses free of an instance `__dict__`
+    __slots__ = ()
+
     def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
         """Execute the implemented behavior.
 
@@ -22,4 +25,4 @@ class Behavior(Protocol):
             See those interfaces for more info.
 
         """
-        ...
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING
 
 from ares.behaviors.behavior import Behavior
 from ares.managers.manager_mediator import ManagerMediator
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-class CombatBehavior(Behavior, Protocol):
+class CombatBehavior(Behavior):
     """Interface that all combat behaviors should adhere to."""
 
     def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
@@ -25,4 +25,4 @@ class CombatBehavior(Behavior, Protocol):
             bool: MacroBehavior carried out an action.
 
         """
-        ...
+        raise NotImplementedError
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from ares.behaviors.combat.individual import CombatIndividualBehavior
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatManeuver(Behavior):
     """Execute behaviors sequentially.
 
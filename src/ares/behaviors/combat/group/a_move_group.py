@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class AMoveGroup(CombatGroupBehavior):
     """A-Move group to a target.
 
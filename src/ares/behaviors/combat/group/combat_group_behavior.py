@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Protocol, Union
+from math import floor
+from typing import TYPE_CHECKING, Union
 
 from cython_extensions import cy_distance_to_squared
 from sc2.ids.ability_id import AbilityId
@@ -12,9 +13,11 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-class CombatGroupBehavior(Behavior, Protocol):
+class CombatGroupBehavior(Behavior):
     """Interface that all group combat behaviors should adhere to."""
 
+    __slots__ = ()
+
     def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
         """Execute the implemented behavior.
 
@@ -26,7 +29,7 @@ class CombatGroupBehavior(Behavior, Protocol):
         Returns:
             bool: CombatGroupBehavior carried out an action.
         """
-        ...
+        raise NotImplementedError
 
     def duplicate_or_similar_order(
         self,
@@ -35,8 +38,9 @@ class CombatGroupBehavior(Behavior, Protocol):
         order_type: AbilityId,
         distance_check_squared: float = 2.0,
     ) -> bool:
+        target_position: Point2 = target.position
         if (
-            cy_distance_to_squared(unit.position, target.position)
+            cy_distance_to_squared(unit.position, target_position)
             < distance_check_squared
         ):
             return True
@@ -47,9 +51,11 @@ class CombatGroupBehavior(Behavior, Protocol):
                 return False
 
             # the pos we calculated is not that different to previous target
+            # (same check as comparing `.rounded`, without building two Point2s)
             if (
                 isinstance(order_target, Point2)
-                and order_target.rounded == target.position.rounded
+                and floor(order_target[0]) == floor(target_position[0])
+                and floor(order_target[1]) == floor(target_position[1])
             ):
                 return True
             if isinstance(order_target, Unit) and order_target == target:
@@ -60,14 +66,19 @@ class CombatGroupBehavior(Behavior, Protocol):
     def group_weapons_on_cooldown(
         self, group: list[Unit], stutter_forward: bool
     ) -> bool:
-        avg_weapon_cooldown: float = sum([u.weapon_cooldown for u in group]) / len(
-            group
-        )
+        num_units: int = len(group)
+        # compare the summed cooldown against threshold * n rather than averaging
+        limit: float = (2.5 if stutter_forward else 5.0) * num_units
+        total_cooldown: float = 0.0
+        for i, unit in enumerate(group):
+            total_cooldown += unit.weapon_cooldown
+            # `weapon_cooldown` is -1 for units that can't attack, so each
+            # remaining unit can lower the total by at most 1
+            if total_cooldown - (num_units - i - 1) > limit:
+                return True
+
         # all weapons are ready, should stay on attack command
-        if avg_weapon_cooldown <= 0.0:
+        if total_cooldown <= 0.0:
             return False
 
-        if stutter_forward:
-            return avg_weapon_cooldown > 2.5
-        else:
-            return avg_weapon_cooldown > 5.0
+        return total_cooldown > limit
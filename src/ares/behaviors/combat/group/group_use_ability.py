@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupUseAbility(CombatGroupBehavior):
     """Issue a single ability command for a group of units.
 
@@ -49,11 +49,16 @@ class GroupUseAbility(CombatGroupBehavior):
         if len(self.group) == 0:
             return False
 
-        issue_command: bool
-        if self.sync_command:
-            issue_command = all([self.ability in u.abilities for u in self.group])
-        else:
-            issue_command = any([self.ability in u.abilities for u in self.group])
+        ability: AbilityId = self.ability
+        sync_command: bool = bool(self.sync_command)
+        # one loop for both modes: with `sync_command` every unit needs the
+        # ability (stop at the first without it), otherwise any unit will do
+        # (stop at the first with it)
+        issue_command: bool = sync_command
+        for u in self.group:
+            if (ability in u.abilities) != sync_command:
+                issue_command = not sync_command
+                break
 
         if not issue_command:
             return False
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class KeepGroupSafe(CombatGroupBehavior):
     """A-Move group to a target.
 
@@ -43,13 +43,19 @@ class KeepGroupSafe(CombatGroupBehavior):
             return False
 
         executed: bool = False
+        # build each inner behavior once and swap the unit in per iteration,
+        # rather than constructing two new objects for every unit
+        shoot_in_range: ShootTargetInRange = ShootTargetInRange(
+            self.group[0], self.close_enemy
+        )
+        keep_safe: KeepUnitSafe = KeepUnitSafe(self.group[0], self.grid)
         for u in self.group:
             if self.attack_in_range_enemy:
-                if ShootTargetInRange(u, self.close_enemy).execute(
-                    ai, config, mediator
-                ):
+                shoot_in_range.unit = u
+                if shoot_in_range.execute(ai, config, mediator):
                     continue
-            if KeepUnitSafe(u, self.grid).execute(ai, config, mediator):
+            keep_safe.unit = u
+            if keep_safe.execute(ai, config, mediator):
                 executed = True
 
         return executed
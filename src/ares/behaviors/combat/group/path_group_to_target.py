@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
-from cython_extensions import cy_closest_to, cy_distance_to
+from cython_extensions import cy_closest_to, cy_distance_to_squared
 from sc2.ids.ability_id import AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class PathGroupToTarget(CombatGroupBehavior):
     """Path a group to its target destination.
 
@@ -43,6 +43,9 @@ class PathGroupToTarget(CombatGroupBehavior):
         group_tags: The units to path.
         grid: 2D grid to path on.
         target: Target destination.
+        distance_check_squared: Squared distance within which a new move
+            is treated as a duplicate of the current order and skipped.
+            Only used when `prevent_duplicate` is True. Defaults to 26.25.
         success_at_distance: If the unit has gotten this close,
             consider the path behavior complete. Defaults to 0.0.
         sensitivity: Path precision. Defaults to 5.
@@ -55,6 +58,10 @@ class PathGroupToTarget(CombatGroupBehavior):
             Defaults to 5.0.
         prevent_duplicate: Whether to try to prevent spamming actions.
             Defaults to True.
+        skip_path_within_squared: If the squared distance from `start` to
+            `target` is below this, move straight to `target` without a
+            pathing query. `grid` is not consulted in that case, so the group
+            may walk through influence. Defaults to 0.0 (always path).
     """
 
     start: Point2
@@ -70,8 +77,10 @@ class PathGroupToTarget(CombatGroupBehavior):
     danger_distance: float = 20.0
     danger_threshold: float = 5.0
     prevent_duplicate: bool = True
+    skip_path_within_squared: float = 0.0
 
-    def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
+    def __post_init__(self) -> None:
+        # validate once on construction rather than on every execute
         assert isinstance(
             self.start, Point2
         ), f"{self.start} should be `Point2`, got {type(self.start)}"
@@ -79,24 +88,30 @@ class PathGroupToTarget(CombatGroupBehavior):
             self.target, Point2
         ), f"{self.target} should be `Point2`, got {type(self.target)}"
 
+    def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
         if len(self.group) == 0:
             return False
 
-        distance_to_target: float = cy_distance_to(self.start, self.target)
+        distance_to_target_sq: float = cy_distance_to_squared(self.start, self.target)
         # no action executed
-        if distance_to_target < self.success_at_distance:
+        if distance_to_target_sq < self.success_at_distance**2:
             return False
 
-        move_to: Point2 = mediator.find_path_next_point(
-            start=self.start,
-            target=self.target,
-            grid=self.grid,
-            sensitivity=self.sensitivity,
-            smoothing=self.smoothing,
-            sense_danger=self.sense_danger,
-            danger_distance=self.danger_distance,
-            danger_threshold=self.danger_threshold,
-        )
+        move_to: Point2
+        # opted in to skipping the pathing query when already close
+        if distance_to_target_sq < self.skip_path_within_squared:
+            move_to = self.target
+        else:
+            move_to = mediator.find_path_next_point(
+                start=self.start,
+                target=self.target,
+                grid=self.grid,
+                sensitivity=self.sensitivity,
+                smoothing=self.smoothing,
+                sense_danger=self.sense_danger,
+                danger_distance=self.danger_distance,
+                danger_threshold=self.danger_threshold,
+            )
 
         if self.prevent_duplicate:
             sample_unit: Unit = cy_closest_to(self.start, self.group)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Union
 
 import numpy as np
-from cython_extensions import cy_distance_to_squared, cy_sorted_by_distance_to
+from cython_extensions import cy_all_points_below_max_value, cy_sorted_by_distance_to
 from sc2.ids.ability_id import AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
@@ -13,19 +13,21 @@ from ares.managers.manager_mediator import ManagerMediator
 if TYPE_CHECKING:
     from ares import AresBot
 
-DIRECTIONS: list[Point2] = [
-    Point2((1, 0)),
-    Point2((-1, 0)),
-    Point2((0, 1)),
-    Point2((0, -1)),  # Cardinal directions
-    Point2((1, 1)),
-    Point2((-1, -1)),
-    Point2((1, -1)),
-    Point2((-1, 1)),  # Diagonal directions
-]
-
-
-@dataclass
+DIRECTIONS: np.ndarray = np.array(
+    [
+        [1.0, 0.0],
+        [-1.0, 0.0],
+        [0.0, 1.0],
+        [0.0, -1.0],  # Cardinal directions
+        [1.0, 1.0],
+        [-1.0, -1.0],
+        [1.0, -1.0],
+        [-1.0, 1.0],  # Diagonal directions
+    ]
+)
+
+
+@dataclass(slots=True)
 class StutterGroupBack(CombatGroupBehavior):
     """Stutter a group back in unison.
 
@@ -49,23 +51,25 @@ class StutterGroupBack(CombatGroupBehavior):
         if len(self.group) == 0:
             return False
 
+        target_position: Point2 = self.target.position
         sorted_units: list[Unit] = cy_sorted_by_distance_to(
-            self.group, self.target.position, reverse=True
+            self.group, target_position, reverse=True
         )
         sample_unit: Unit = sorted_units[0]
 
+        ability: AbilityId
+        order_target: Point2
+        # what the duplicate order check compares against
+        check_target: Union[Point2, Unit]
         if self.group_weapons_on_cooldown(self.group, stutter_forward=False):
-            group_safe: bool = True
-            for unit in self.group:
-                if not mediator.is_position_safe(
-                    grid=self.grid, position=unit.position
-                ):
-                    group_safe = False
-                    break
-            if group_safe:
+            if cy_all_points_below_max_value(
+                self.grid, 1.0, [u.position.rounded for u in self.group]
+            ):
                 return True
             if len(self.group) > 1:
-                move_to_target: Point2 = self._calculate_retreat_position(ai)
+                move_to_target: Point2 = self._calculate_retreat_position(
+                    ai, target_position
+                )
                 safe_spot: Point2 = mediator.find_closest_safe_spot(
                     from_pos=move_to_target, grid=self.grid
                 )
@@ -74,51 +78,52 @@ class StutterGroupBack(CombatGroupBehavior):
                     from_pos=self.group_position, grid=self.grid
                 )
 
-            if ai.in_pathing_grid(safe_spot):
-                group_move_to: Point2 = mediator.find_path_next_point(
-                    start=self.group_position,
-                    target=safe_spot,
-                    grid=self.grid,
-                    sensitivity=min(len(self.group), 8),
-                )
-                if self.duplicate_or_similar_order(
-                    sample_unit, group_move_to, AbilityId.MOVE
-                ):
-                    return True
-                ai.give_same_action(AbilityId.MOVE, self.group_tags, group_move_to)
-        else:
-            if self.duplicate_or_similar_order(
-                sample_unit, self.target, AbilityId.ATTACK
-            ):
+            if not ai.in_pathing_grid(safe_spot):
                 return True
-            ai.give_same_action(AbilityId.ATTACK, self.group_tags, self.target.position)
+
+            ability = AbilityId.MOVE
+            order_target = mediator.find_path_next_point(
+                start=self.group_position,
+                target=safe_spot,
+                grid=self.grid,
+                sensitivity=min(len(self.group), 8),
+            )
+            check_target = order_target
+        else:
+            ability = AbilityId.ATTACK
+            order_target = target_position
+            check_target = self.target
+
+        if not self.duplicate_or_similar_order(sample_unit, check_target, ability):
+            ai.give_same_action(ability, self.group_tags, order_target)
 
         return True
 
-    def _calculate_retreat_position(self, ai: "AresBot") -> Point2:
+    def _calculate_retreat_position(
+        self, ai: "AresBot", target_position: Point2
+    ) -> Point2:
         """Search 8 directions for somewhere to retreat to."""
         distance = len(self.group) * 1.5
 
         map_bounds = ai.game_info.map_size
-        best_position: Point2 = self.group_position
-        max_distance_from_target: float = 0.0
-
-        for direction in DIRECTIONS:
-            retreat_position: Point2 = self.group_position + direction * distance
-            retreat_position = Point2(
-                (
-                    max(0, min(map_bounds[0] - 1, retreat_position.x)),
-                    max(0, min(map_bounds[1] - 1, retreat_position.y)),
-                )
-            )
-
-            if ai.in_pathing_grid(retreat_position):
-                distance_from_target: float = cy_distance_to_squared(
-                    self.target.position, retreat_position
-                )
+        # score all candidates in one go, then take the furthest pathable one
+        candidates: np.ndarray = np.clip(
+            np.asarray(self.group_position) + DIRECTIONS * distance,
+            0,
+            (map_bounds[0] - 1, map_bounds[1] - 1),
+        )
+        diff: np.ndarray = candidates - np.asarray(target_position)
+        distances_from_target: np.ndarray = np.einsum("ij,ij->i", diff, diff)
+        # same check as `ai.in_pathing_grid`, pathing grid is indexed [y, x]
+        cells: np.ndarray = candidates.astype(int)
+        pathable: np.ndarray = (
+            ai.game_info.pathing_grid.data_numpy[cells[:, 1], cells[:, 0]] == 1
+        )
 
-                if distance_from_target > max_distance_from_target:
-                    max_distance_from_target = distance_from_target
-                    best_position = retreat_position
+        for i in np.argsort(-distances_from_target, kind="stable"):
+            if distances_from_target[i] <= 0.0:
+                break
+            if pathable[i]:
+                return Point2(candidates[i].tolist())
 
-        return best_position
+        return self.group_position
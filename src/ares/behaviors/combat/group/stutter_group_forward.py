@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Union
 
-from cython_extensions import cy_center, cy_in_attack_range, cy_sorted_by_distance_to
+from cython_extensions import cy_center, cy_closest_to, cy_in_attack_range
 from sc2.ids.ability_id import AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class StutterGroupForward(CombatGroupBehavior):
     """Stutter a group forward in unison.
 
@@ -41,10 +41,7 @@ class StutterGroupForward(CombatGroupBehavior):
         if not self.enemies:
             return False
 
-        sorted_units: list[Unit] = cy_sorted_by_distance_to(
-            self.group, self.target.position
-        )
-        sample_unit: Unit = sorted_units[0]
+        sample_unit: Unit = cy_closest_to(self.target.position, self.group)
 
         # if all units are in range of something, don't worry about moving
         all_in_range: bool = True
@@ -56,26 +53,21 @@ class StutterGroupForward(CombatGroupBehavior):
                 all_in_range = False
                 break
 
+        ability: AbilityId
+        # what the duplicate order check compares against
+        check_target: Union[Point2, Unit]
         # if the whole group are in range of something, then don't bother moving
         if all_in_range:
-            if not self.duplicate_or_similar_order(
-                sample_unit, self.target, AbilityId.ATTACK
-            ):
-                ai.give_same_action(AbilityId.ATTACK, self.group_tags, enemy_center)
-
-            return True
-
-        if self.group_weapons_on_cooldown(self.group, stutter_forward=True):
-            if self.duplicate_or_similar_order(
-                sample_unit, enemy_center, AbilityId.MOVE
-            ):
-                return True
-            ai.give_same_action(AbilityId.MOVE, self.group_tags, enemy_center)
+            ability = AbilityId.ATTACK
+            check_target = self.target
+        elif self.group_weapons_on_cooldown(self.group, stutter_forward=True):
+            ability = AbilityId.MOVE
+            check_target = enemy_center
         else:
-            if self.duplicate_or_similar_order(
-                sample_unit, enemy_center, AbilityId.ATTACK
-            ):
-                return True
-            ai.give_same_action(AbilityId.ATTACK, self.group_tags, enemy_center)
+            ability = AbilityId.ATTACK
+            check_target = enemy_center
+
+        if not self.duplicate_or_similar_order(sample_unit, check_target, ability):
+            ai.give_same_action(ability, self.group_tags, enemy_center)
 
         return True
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class AMove(CombatIndividualBehavior):
     """A-Move a unit to a target.
 
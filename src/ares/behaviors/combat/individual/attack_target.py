@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackTarget(CombatIndividualBehavior):
     """Shoot a target.
 
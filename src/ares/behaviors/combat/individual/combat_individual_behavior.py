@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING
 
 from ares.behaviors.behavior import Behavior
 from ares.managers.manager_mediator import ManagerMediator
@@ -7,9 +7,11 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-class CombatIndividualBehavior(Behavior, Protocol):
+class CombatIndividualBehavior(Behavior):
     """Interface that all combat behaviors should adhere to."""
 
+    __slots__ = ()
+
     def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
         """Execute the implemented behavior.
 
@@ -26,4 +28,4 @@ class CombatIndividualBehavior(Behavior, Protocol):
                 False otherwise.
 
         """
-        ...
+        raise NotImplementedError
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class DropCargo(CombatIndividualBehavior):
     """Handle releasing cargo from a container.
 
@@ -40,7 +40,16 @@ class DropCargo(CombatIndividualBehavior):
     def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
         # TODO: Expand logic as needed, initial working version.
         # no action executed
-        if self.unit.cargo_used == 0 or not ai.in_pathing_grid(self.unit.position):
+        if self.unit.cargo_used == 0:
+            return False
+
+        unit_pos: Point2 = self.unit.position
+        # same check as `ai.in_pathing_grid` without the asserts and rounded Point2,
+        # pathing grid is indexed [y, x]
+        if (
+            ai.game_info.pathing_grid.data_numpy[int(unit_pos[1]), int(unit_pos[0])]
+            != 1
+        ):
             return False
 
         ai.do_unload_container(self.unit.tag)
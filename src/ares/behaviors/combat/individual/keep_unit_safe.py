@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class KeepUnitSafe(CombatIndividualBehavior):
     """Get a unit to safety based on the influence grid passed in.
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
-from cython_extensions import cy_distance_to
+from cython_extensions import cy_distance_to_squared
 from sc2.position import Point2
 from sc2.unit import Unit
 
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class PathUnitToTarget(CombatIndividualBehavior):
     """Path a unit to its target destination.
 
@@ -60,9 +60,11 @@ class PathUnitToTarget(CombatIndividualBehavior):
     danger_threshold: float = 5.0
 
     def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
-        distance_to_target: float = cy_distance_to(self.unit.position, self.target)
+        distance_to_target_sq: float = cy_distance_to_squared(
+            self.unit.position, self.target
+        )
         # no action executed
-        if distance_to_target < self.success_at_distance:
+        if distance_to_target_sq < self.success_at_distance**2:
             return False
 
         move_to: Point2 = mediator.find_path_next_point(
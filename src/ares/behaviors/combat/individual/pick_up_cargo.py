@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
-from cython_extensions import cy_closest_to, cy_distance_to
+from cython_extensions import cy_closest_to, cy_distance_to_squared
 from sc2.ids.ability_id import AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
@@ -12,14 +12,14 @@ from ares.behaviors.combat.individual.combat_individual_behavior import (
     CombatIndividualBehavior,
 )
 from ares.consts import UnitRole
-from ares.dicts.pickup_range import PICKUP_RANGE
+from ares.dicts.pickup_range import PICKUP_RANGE, PICKUP_RANGE_SQ
 from ares.managers.manager_mediator import ManagerMediator
 
 if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class PickUpCargo(CombatIndividualBehavior):
     """Handle loading cargo into a container.
 
@@ -60,9 +60,9 @@ class PickUpCargo(CombatIndividualBehavior):
 
         unit_pos: Point2 = self.unit.position
         target: Unit = cy_closest_to(unit_pos, self.pickup_targets)
-        distance: float = cy_distance_to(self.unit.position, target.position)
+        distance_sq: float = cy_distance_to_squared(unit_pos, target.position)
 
-        if distance <= PICKUP_RANGE[self.unit.type_id]:
+        if distance_sq <= PICKUP_RANGE_SQ[self.unit.type_id]:
             self.unit(AbilityId.SMART, target)
         else:
             move_to: Point2 = mediator.find_path_next_point(
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class PlacePredictiveAoE(CombatIndividualBehavior):
     """Predict an enemy position and fire AoE accordingly.
 
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class ShootTargetInRange(CombatIndividualBehavior):
     """Find something to shoot at.
 
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class StutterUnitBack(CombatIndividualBehavior):
     """Shoot at the target if possible, else move back.
 
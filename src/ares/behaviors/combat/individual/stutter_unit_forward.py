@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class StutterUnitForward(CombatIndividualBehavior):
     """Shoot at the target if possible, else move back.
 
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
-@dataclass
+@dataclass(slots=True)
 class UseAbility(CombatIndividualBehavior):
     """A-Move a unit to a target.
 
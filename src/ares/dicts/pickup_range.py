@@ -6,3 +6,8 @@ PICKUP_RANGE: dict[UnitID, float] = {
     UnitID.OVERLORDTRANSPORT: 5.0,
     UnitID.WARPPRISM: 5.0,
 }
+# compare against squared distances to avoid a sqrt
+PICKUP_RANGE_SQ: dict[UnitID, float] = {
+    unit_type: pickup_range * pickup_range
+    for unit_type, pickup_range in PICKUP_RANGE.items()
+}
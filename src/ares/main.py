@@ -380,7 +380,8 @@ class AresBot(CustomBotAI):
         self.behavior_executioner.execute()
         for drop_action in self._drop_unload_actions:
             await self.unload_container(drop_action[0], drop_action[1])
-        for same_order in self._same_order_actions:
+        # identical orders from different behaviors go out as one request
+        for same_order in self._merge_same_order_actions():
             await self._give_units_same_order(
                 same_order[0], same_order[1], same_order[2]
             )
@@ -717,6 +718,38 @@ class AresBot(CustomBotAI):
             if owner_tag in self.adept_tags_with_shades_assigned:
                 self.adept_tags_with_shades_assigned.remove(owner_tag)
 
+    def _merge_same_order_actions(
+        self,
+    ) -> list[tuple[AbilityId, Set[int], Optional[Union[Unit, Point2]]]]:
+        """Combine queued same order actions sharing an ability and target.
+
+        Tags are only folded into an earlier action if no action queued in
+        between them involves any of those tags, so every unit still ends
+        up with the same order.
+
+        Returns
+        -------
+        list[tuple[AbilityId, Set[int], Optional[Union[Unit, Point2]]]] :
+            Actions to send, in the order they should be sent.
+        """
+        merged: list[tuple[AbilityId, Set[int], Optional[Union[Unit, Point2]]]] = []
+        # (ability, target) -> index of the latest action for it in `merged`
+        merged_index: Dict[tuple, int] = {}
+        for order, unit_tags, target in self._same_order_actions:
+            tags: Set[int] = unit_tags if isinstance(unit_tags, set) else set(unit_tags)
+            key: tuple = (order, target)
+            index: Optional[int] = merged_index.get(key)
+            if index is not None and all(
+                tags.isdisjoint(merged[i][1]) for i in range(index + 1, len(merged))
+            ):
+                # new set, the caller's tags shouldn't be modified
+                merged[index] = (order, merged[index][1] | tags, target)
+            else:
+                merged_index[key] = len(merged)
+                merged.append((order, tags, target))
+
+        return merged
+
     def _record_shade(self, shade: RawUnit) -> None:
         """Add an Adept Shade to the tracking dictionary
 
@@ -1,7 +1,7 @@
 """Handle pathing and grid information.
 
 """
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import numpy as np
 from cython_extensions import cy_distance_to_squared, cy_point_below_value
@@ -10,7 +10,6 @@ from sc2.ids.effect_id import EffectId
 from sc2.ids.unit_typeid import UnitTypeId as UnitID
 from sc2.position import Point2
 from sc2.unit import Unit
-from scipy import spatial
 from scipy.spatial import KDTree
 
 from ares.consts import (
@@ -185,6 +184,11 @@ class PathManager(Manager, IManagerMediator):
         self.whole_map_tree: KDTree = KDTree(self.whole_map)
         # vague attempt at not recalculating np.argwhere for danger tiles
         self.calculated_danger_tiles: List[Dict[str, Union[np.ndarray, int]]] = []
+        # next path points found this step, grids are rebuilt every step so
+        # this is cleared in `reset_grids`
+        self._path_next_point_cache: Dict[tuple, tuple] = {}
+        # same for closest safe spots
+        self._closest_safe_spot_cache: Dict[tuple, tuple] = {}
         self.forcefield_positions: List[Point2] = []
         # biles / nukes
         self.delayed_effects: Dict[int, int] = {}
@@ -248,7 +252,8 @@ class PathManager(Manager, IManagerMediator):
 
         # update creep grid
         self.creep_ground_grid = self.ground_grid.copy()
-        self.creep_ground_grid[np.where(self.ai.state.creep.data_numpy.T != 1)] = np.inf
+        # boolean mask straight off the transposed view, no index arrays needed
+        self.creep_ground_grid[self.ai.state.creep.data_numpy.T != 1] = np.inf
 
         if self.debug and self.config[DEBUG_OPTIONS][SHOW_PATHING_COST]:
             if self.config[DEBUG_OPTIONS][ACTIVE_GRID] == AIR:
@@ -358,6 +363,12 @@ class PathManager(Manager, IManagerMediator):
     ) -> Point2:
         """Find the closest point with the lowest cost on a grid.
 
+        Results are reused for the rest of the step when the same grid object
+        is queried again with the same `from_pos` and `radius`. The cache is
+        keyed on the grid's identity, not its contents, so editing a grid in
+        place after querying it returns the old answer until `reset_grids`
+        runs.
+
         Parameters
         ----------
         from_pos :
@@ -373,15 +384,23 @@ class PathManager(Manager, IManagerMediator):
             The closest location with the lowest cost.
 
         """
+        # same query on the same grid this step, reuse the answer
+        key: tuple = (id(grid), from_pos[0], from_pos[1], radius)
+        if key in self._closest_safe_spot_cache:
+            return self._closest_safe_spot_cache[key][1]
+
         all_safe: np.ndarray = self.map_data.lowest_cost_points_array(
             from_pos, radius, grid
         )
-        # type hint wants a numpy array but doesn't actually need one - this is faster
-        all_dists = spatial.distance.cdist(all_safe, [from_pos], "sqeuclidean")
-        min_index = np.argmin(all_dists)
-
-        # safe because the shape of all_dists (N x 1) means argmin will return an int
-        return Point2(all_safe[min_index])
+        # single query point, so a plain sum of squares beats the `cdist` dispatch
+        # and skips allocating an (N x 1) distance matrix
+        diff: np.ndarray = all_safe - np.asarray(from_pos)
+        min_index: int = int(np.einsum("ij,ij->i", diff, diff).argmin())
+
+        safe_spot: Point2 = Point2(all_safe[min_index])
+        # hold on to the grid so its id can't be reused while cached
+        self._closest_safe_spot_cache[key] = (grid, safe_spot)
+        return safe_spot
 
     def find_furthest_safe_spot(
         self, from_pos: Point2, grid: np.ndarray, radius: int = 15
@@ -465,6 +484,12 @@ class PathManager(Manager, IManagerMediator):
     ) -> Point2:
         """Find the next point in a path.
 
+        Pathfinding results are reused for the rest of the step when the same
+        grid object is queried again with the same start, target, sensitivity
+        and smoothing. The cache is keyed on the grid's identity, not its
+        contents, so editing a grid in place after querying it returns the
+        old answer until `reset_grids` runs.
+
         Parameters
         ----------
         start :
@@ -523,24 +548,43 @@ class PathManager(Manager, IManagerMediator):
                     }
                 )
             if dangers.shape[0] > 0:
-                # get distance of the closest dangerous cell
-                closest_danger_distance: float = spatial.distance.cdist(
-                    [start], dangers
+                # get squared distance of the closest dangerous cell
+                diff: np.ndarray = dangers - np.asarray(start)
+                closest_danger_distance_sq: float = np.einsum(
+                    "ij,ij->i", diff, diff
                 ).min()
                 # the closest danger is too far away, no need for pathing query
-                if closest_danger_distance >= danger_distance:
+                if closest_danger_distance_sq >= danger_distance * danger_distance:
                     return target
             # didn't find any danger at all
             else:
                 return target
 
-        path: List[Point2] = self.map_data.pathfind(
-            start, target, grid, sensitivity=sensitivity, smoothing=smoothing
+        # same query on the same grid this step, skip the pathfinder
+        key: tuple = (
+            id(grid),
+            start[0],
+            start[1],
+            target[0],
+            target[1],
+            sensitivity,
+            smoothing,
         )
-        if not path or len(path) == 0:
+        next_point: Optional[Point2]
+        if key in self._path_next_point_cache:
+            next_point = self._path_next_point_cache[key][1]
+        else:
+            path: List[Point2] = self.map_data.pathfind(
+                start, target, grid, sensitivity=sensitivity, smoothing=smoothing
+            )
+            next_point = path[0] if path else None
+            # hold on to the grid so its id can't be reused while cached
+            self._path_next_point_cache[key] = (grid, next_point)
+
+        if next_point is None:
             return target
         else:
-            return path[0]
+            return next_point
 
     def raw_pathfind(
         self, start: Point2, target: Point2, grid: np.ndarray, sensitivity: int
@@ -601,6 +645,8 @@ class PathManager(Manager, IManagerMediator):
         self.ground_avoidance_grid = self._cached_clean_ground_grid.copy()
         self.priority_ground_avoidance_grid = self._cached_clean_ground_grid.copy()
         self.ground_to_air_grid = self._cached_clean_air_grid.copy()
+        self._path_next_point_cache = {}
+        self._closest_safe_spot_cache = {}
 
         # Refresh the cached ground grid every 8 steps, because things like structures/
         # minerals / rocks will change throughout the game
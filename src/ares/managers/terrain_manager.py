@@ -4,7 +4,7 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import numpy as np
-from cython_extensions import cy_flood_fill_grid
+from cython_extensions import cy_distance_to_squared, cy_flood_fill_grid
 from map_analyzer import MapData
 from map_analyzer.constructs import ChokeArea, VisionBlockerArea
 from sc2.game_info import Ramp
@@ -284,9 +284,10 @@ class TerrainManager(Manager, IManagerMediator):
             sc2 Ramp object for the opponent's main ramp.
 
         """
+        enemy_start: Point2 = self.ai.enemy_start_locations[0]
         return min(
             (ramp for ramp in self.ai.game_info.map_ramps if len(ramp.upper) in {2, 5}),
-            key=lambda r: self.ai.enemy_start_locations[0].distance_to(r.top_center),
+            key=lambda r: cy_distance_to_squared(enemy_start, r.top_center),
         )
 
     @property_cache_once_per_frame
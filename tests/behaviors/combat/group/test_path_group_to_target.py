@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+from sc2.ids.unit_typeid import UnitTypeId as UnitID
+from sc2.position import Point2
+from sc2.unit import Unit
+
+from ares import AresBot
+from ares.behaviors.combat.group import PathGroupToTarget
+
+pytest_plugins = ("pytest_asyncio",)
+
+MAPS: list[Path] = [
+    map_path
+    for map_path in (
+        Path(__file__).parent.parent.parent.parent / "pickle_data"
+    ).iterdir()
+    if map_path.suffix == ".xz"
+]
+
+
+@pytest.mark.parametrize("bot", MAPS, indirect=True)
+class TestPathGroupToTarget:
+    def test_path_group_to_target_skip_path(
+        self, bot: AresBot, event_loop, monkeypatch
+    ):
+        """
+        Test the path query is only skipped when opted in and close enough
+        """
+        path_queries: list[dict] = []
+
+        def find_path_next_point(**kwargs) -> Point2:
+            path_queries.append(kwargs)
+            return kwargs["target"]
+
+        monkeypatch.setattr(bot.mediator, "find_path_next_point", find_path_next_point)
+        units: list[Unit] = [u for u in bot.units if u.type_id != UnitID.SCV]
+        start: Point2 = units[0].position
+        target: Point2 = start.towards(bot.game_info.map_center, 3.0)
+        original_actions = bot._same_order_actions
+        # queue onto a fresh list so the fixture's actions are left untouched
+        bot._same_order_actions = []
+        try:
+            # default, close targets still use the pathfinder
+            PathGroupToTarget(
+                start,
+                units,
+                {u.tag for u in units},
+                bot.mediator.get_ground_grid,
+                target,
+                prevent_duplicate=False,
+            ).execute(bot, bot.config, bot.mediator)
+            assert len(path_queries) == 1
+
+            # opted in and within range, pathfinder is bypassed
+            PathGroupToTarget(
+                start,
+                units,
+                {u.tag for u in units},
+                bot.mediator.get_ground_grid,
+                target,
+                prevent_duplicate=False,
+                skip_path_within_squared=16.0,
+            ).execute(bot, bot.config, bot.mediator)
+            assert len(path_queries) == 1
+
+            # opted in but too far away, pathfinder is used
+            PathGroupToTarget(
+                start,
+                units,
+                {u.tag for u in units},
+                bot.mediator.get_ground_grid,
+                target,
+                prevent_duplicate=False,
+                skip_path_within_squared=4.0,
+            ).execute(bot, bot.config, bot.mediator)
+            assert len(path_queries) == 2
+        finally:
+            bot._same_order_actions = original_actions
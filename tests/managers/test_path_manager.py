@@ -68,3 +68,83 @@ class TestPathManager:
         assert air_vs_ground_grid[unit.position.rounded] > 1.0
         assert grid[unit.position.rounded] > 1.0
         assert climber[unit.position.rounded] > 1.0
+
+    def test_find_path_next_point_cache(self, bot: AresBot, event_loop, monkeypatch):
+        """
+        Test that repeated path queries in a step reuse the pathfinding result
+        """
+        path_manager: PathManager = bot.manager_hub.path_manager
+        pathfind_calls: list[tuple] = []
+
+        def pathfind(start, target, grid, sensitivity, smoothing):
+            pathfind_calls.append((start, target, sensitivity))
+            return [Point2((start[0] + 1.0, start[1]))]
+
+        monkeypatch.setattr(path_manager.map_data, "pathfind", pathfind)
+
+        # arrange
+        grid: np.ndarray = bot.mediator.get_ground_grid
+        start: Point2 = bot.start_location
+        target: Point2 = bot.game_info.map_center
+
+        # act / assert
+        # first query goes to the pathfinder
+        first: Point2 = path_manager.find_path_next_point(
+            start, target, grid, sense_danger=False
+        )
+        assert len(pathfind_calls) == 1
+        # identical query is served from the cache
+        assert (
+            path_manager.find_path_next_point(start, target, grid, sense_danger=False)
+            == first
+        )
+        assert len(pathfind_calls) == 1
+        # a different grid or sensitivity misses the cache
+        path_manager.find_path_next_point(
+            start, target, grid.copy(), sense_danger=False
+        )
+        assert len(pathfind_calls) == 2
+        path_manager.find_path_next_point(
+            start, target, grid, sensitivity=3, sense_danger=False
+        )
+        assert len(pathfind_calls) == 3
+        # resetting the grids clears the cache
+        path_manager.reset_grids(bot.actual_iteration)
+        path_manager.find_path_next_point(start, target, grid, sense_danger=False)
+        assert len(pathfind_calls) == 4
+
+    def test_find_closest_safe_spot_cache(self, bot: AresBot, event_loop, monkeypatch):
+        """
+        Test that repeated safe spot queries in a step reuse the search result
+        """
+        path_manager: PathManager = bot.manager_hub.path_manager
+        search_calls: list[tuple] = []
+
+        def lowest_cost_points_array(from_pos, radius, grid):
+            search_calls.append((from_pos, radius))
+            return np.array([[from_pos[0] + 1.0, from_pos[1]]])
+
+        monkeypatch.setattr(
+            path_manager.map_data, "lowest_cost_points_array", lowest_cost_points_array
+        )
+
+        # arrange
+        grid: np.ndarray = bot.mediator.get_ground_grid
+        from_pos: Point2 = bot.start_location
+
+        # act / assert
+        # first query runs the search
+        first: Point2 = path_manager.find_closest_safe_spot(from_pos, grid)
+        assert len(search_calls) == 1
+        # identical query is served from the cache
+        assert path_manager.find_closest_safe_spot(from_pos, grid) == first
+        assert len(search_calls) == 1
+        # a different grid or radius misses the cache
+        path_manager.find_closest_safe_spot(from_pos, grid.copy())
+        assert len(search_calls) == 2
+        path_manager.find_closest_safe_spot(from_pos, grid, radius=3)
+        assert len(search_calls) == 3
+        # resetting the grids clears the cache
+        path_manager.reset_grids(bot.actual_iteration)
+        path_manager.find_closest_safe_spot(from_pos, grid)
+        assert len(search_calls) == 4
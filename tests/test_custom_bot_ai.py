@@ -1,6 +1,8 @@
 from pathlib import Path
 
 import pytest
+from sc2.ids.ability_id import AbilityId
+from sc2.position import Point2
 
 from ares import AresBot
 
@@ -26,3 +28,32 @@ class TestCustomBotAI:
         ground, flying = bot.split_ground_fliers(bot.workers)
         assert len(ground) == 15
         assert len(flying) == 0
+
+    def test_merge_same_order_actions(self, bot: AresBot, event_loop):
+        """
+        Test that identical orders are merged without changing any unit's order
+        """
+        target: Point2 = bot.game_info.map_center
+        group_tags: set[int] = {1, 2}
+        original_actions = bot._same_order_actions
+        bot._same_order_actions = [
+            (AbilityId.MOVE, group_tags, target),
+            (AbilityId.ATTACK, {3}, target),
+            (AbilityId.MOVE, [4], target),
+            (AbilityId.ATTACK, {1}, target),
+            (AbilityId.MOVE, {1}, target),
+        ]
+
+        try:
+            merged = bot._merge_same_order_actions()
+
+            # tag 1 was ordered in between, so the last move can't be folded back
+            assert merged == [
+                (AbilityId.MOVE, {1, 2, 4}, target),
+                (AbilityId.ATTACK, {1, 3}, target),
+                (AbilityId.MOVE, {1}, target),
+            ]
+            # caller's tags are left alone
+            assert group_tags == {1, 2}
+        finally:
+            bot._same_order_actions = original_actions